@@ -1,29 +1,35 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from starlette.requests import Request
 from starlette.responses import Response
 
-from mcp.server.auth.json_response import PydanticJSONResponse
 from mcp.shared.auth import OAuthMetadata, ProtectedResourceMetadata
 
+# Metadata documents never change for a running server, so let clients cache them
+METADATA_HEADERS = {"Cache-Control": "public, max-age=3600"}  # Cache for 1 hour
+
 
 @dataclass
 class MetadataHandler:
     metadata: OAuthMetadata
+    # Serialized once, the metadata is immutable for the server's lifetime
+    body: bytes = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.body = self.metadata.model_dump_json(exclude_none=True).encode("utf-8")
 
     async def handle(self, request: Request) -> Response:
-        return PydanticJSONResponse(
-            content=self.metadata,
-            headers={"Cache-Control": "public, max-age=3600"},  # Cache for 1 hour
-        )
+        return Response(content=self.body, media_type="application/json", headers=METADATA_HEADERS)
 
 
 @dataclass
 class ProtectedResourceMetadataHandler:
     metadata: ProtectedResourceMetadata
+    # Serialized once, the metadata is immutable for the server's lifetime
+    body: bytes = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.body = self.metadata.model_dump_json(exclude_none=True).encode("utf-8")
 
     async def handle(self, request: Request) -> Response:
-        return PydanticJSONResponse(
-            content=self.metadata,
-            headers={"Cache-Control": "public, max-age=3600"},  # Cache for 1 hour
-        )
+        return Response(content=self.body, media_type="application/json", headers=METADATA_HEADERS)
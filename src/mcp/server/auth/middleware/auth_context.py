@@ -1,8 +1,10 @@
 import contextvars
 
+from starlette.authentication import AuthCredentials, UnauthenticatedUser
+from starlette.requests import HTTPConnection
 from starlette.types import ASGIApp, Receive, Scope, Send
 
-from mcp.server.auth.middleware.bearer_auth import AuthenticatedUser
+from mcp.server.auth.middleware.bearer_auth import AuthenticatedUser, BearerAuthBackend
 from mcp.server.auth.provider import AccessToken
 
 # Create a contextvar to store the authenticated user
@@ -46,3 +48,41 @@ class AuthContextMiddleware:
         else:
             # No authenticated user, just process the request
             await self.app(scope, receive, send)
+
+
+class BearerAuthContextMiddleware:
+    """
+    Middleware that authenticates the request's Bearer token and stores the
+    authenticated user in a contextvar.
+
+    This is equivalent to Starlette's AuthenticationMiddleware with a
+    BearerAuthBackend followed by AuthContextMiddleware, folded into a single
+    ASGI callable so each request passes through one middleware layer instead of two.
+    Like the pair it replaces, it does not require authentication; that is left
+    to RequireAuthMiddleware on the protected routes.
+    """
+
+    def __init__(self, app: ASGIApp, backend: BearerAuthBackend):
+        self.app = app
+        self.backend = backend
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+
+        auth_result = await self.backend.authenticate(HTTPConnection(scope))
+        if auth_result is None:
+            scope["auth"] = AuthCredentials()
+            scope["user"] = UnauthenticatedUser()
+            await self.app(scope, receive, send)
+            return
+
+        scope["auth"], user = auth_result
+        scope["user"] = user
+        # Set the authenticated user in the contextvar
+        token = auth_context_var.set(user)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            auth_context_var.reset(token)
@@ -1,5 +1,6 @@
 import json
 import time
+from collections.abc import Sequence
 from typing import Any
 
 from pydantic import AnyHttpUrl
@@ -28,10 +29,8 @@ class BearerAuthBackend(AuthenticationBackend):
         self.token_verifier = token_verifier
 
     async def authenticate(self, conn: HTTPConnection):
-        auth_header = next(
-            (conn.headers.get(key) for key in conn.headers if key.lower() == "authorization"),
-            None,
-        )
+        # Header lookup is case-insensitive
+        auth_header = conn.headers.get("authorization")
         if not auth_header or not auth_header.lower().startswith("bearer "):
             return None
 
@@ -60,7 +59,7 @@ class RequireAuthMiddleware:
     def __init__(
         self,
         app: Any,
-        required_scopes: list[str],
+        required_scopes: Sequence[str],
         resource_metadata_url: AnyHttpUrl | None = None,
     ):
         """
@@ -68,12 +67,15 @@ class RequireAuthMiddleware:
 
         Args:
             app: ASGI application
-            required_scopes: List of scopes that the token must have
+            required_scopes: Scopes that the token must have
             resource_metadata_url: Optional protected resource metadata URL for WWW-Authenticate header
         """
         self.app = app
         self.required_scopes = required_scopes
         self.resource_metadata_url = resource_metadata_url
+        # Checked as a subset on every request; the ordered sequence is only needed to
+        # report the first missing scope
+        self._required_scope_set = frozenset(required_scopes)
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         auth_user = scope.get("user")
@@ -84,14 +86,16 @@ class RequireAuthMiddleware:
             return
 
         auth_credentials = scope.get("auth")
+        # auth_credentials should always be provided; this is just paranoia
+        granted_scopes = auth_credentials.scopes if auth_credentials is not None else []
 
-        for required_scope in self.required_scopes:
-            # auth_credentials should always be provided; this is just paranoia
-            if auth_credentials is None or required_scope not in auth_credentials.scopes:
-                await self._send_auth_error(
-                    send, status_code=403, error="insufficient_scope", description=f"Required scope: {required_scope}"
-                )
-                return
+        if not self._required_scope_set.issubset(granted_scopes):
+            # Report the first missing scope, in the order the scopes were required
+            missing_scope = next(s for s in self.required_scopes if s not in granted_scopes)
+            await self._send_auth_error(
+                send, status_code=403, error="insufficient_scope", description=f"Required scope: {missing_scope}"
+            )
+            return
 
         await self.app(scope, receive, send)
 
@@ -1,3 +1,6 @@
+import hashlib
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Generic, Literal, Protocol, TypeVar
 from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
@@ -304,3 +307,46 @@ class ProviderTokenVerifier(TokenVerifier):
     async def verify_token(self, token: str) -> AccessToken | None:
         """Verify token using the provider's load_access_token method."""
         return await self.provider.load_access_token(token)
+
+
+class CachingTokenVerifier(TokenVerifier):
+    """Token verifier that caches successful verifications of another verifier.
+
+    Useful when verification is expensive, e.g. a remote introspection call.
+    Tokens are keyed by their SHA-256 digest so raw tokens are not retained.
+    Entries expire after ttl_seconds or at the token's own expiry, whichever
+    comes first. Failed verifications are never cached.
+    """
+
+    def __init__(self, verifier: TokenVerifier, ttl_seconds: float = 300, max_size: int = 1024):
+        self.verifier = verifier
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        # digest -> (access token, cache expiry); ordered by recency of use
+        self._cache: OrderedDict[str, tuple[AccessToken, float]] = OrderedDict()
+
+    async def verify_token(self, token: str) -> AccessToken | None:
+        """Verify token, reusing a cached result if one is still valid."""
+        key = hashlib.sha256(token.encode()).hexdigest()
+        now = time.time()
+
+        cached = self._cache.get(key)
+        if cached is not None:
+            access_token, expires_at = cached
+            if expires_at > now:
+                self._cache.move_to_end(key)
+                return access_token
+            del self._cache[key]
+
+        access_token = await self.verifier.verify_token(token)
+        if access_token is None:
+            return None
+
+        expires_at = now + self.ttl_seconds
+        if access_token.expires_at is not None:
+            expires_at = min(expires_at, access_token.expires_at)
+        self._cache[key] = (access_token, expires_at)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+        return access_token
@@ -21,6 +21,11 @@ class AuthSettings(BaseModel):
     client_registration_options: ClientRegistrationOptions | None = None
     revocation_options: RevocationOptions | None = None
     required_scopes: list[str] | None = None
+    token_cache_ttl_seconds: float = Field(
+        300,
+        description="How long a successful token_verifier result is cached for repeated "
+        "presentations of the same token. Set to 0 to verify every request.",
+    )
 
     # Resource Server settings (when operating as RS only)
     resource_server_url: AnyHttpUrl | None = Field(
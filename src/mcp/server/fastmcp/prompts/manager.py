@@ -14,6 +14,12 @@ class PromptManager:
     def __init__(self, warn_on_duplicate_prompts: bool = True):
         self._prompts: dict[str, Prompt] = {}
         self.warn_on_duplicate_prompts = warn_on_duplicate_prompts
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """Counter bumped whenever the registered prompts change."""
+        return self._version
 
     def get_prompt(self, name: str) -> Prompt | None:
         """Get prompt by name."""
@@ -37,6 +43,7 @@ class PromptManager:
             return existing
 
         self._prompts[prompt.name] = prompt
+        self._version += 1
         return prompt
 
     async def render_prompt(self, name: str, arguments: dict[str, Any] | None = None) -> list[Message]:
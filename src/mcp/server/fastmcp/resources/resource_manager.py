@@ -19,6 +19,12 @@ class ResourceManager:
         self._resources: dict[str, Resource] = {}
         self._templates: dict[str, ResourceTemplate] = {}
         self.warn_on_duplicate_resources = warn_on_duplicate_resources
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """Counter bumped whenever the registered resources and templates change."""
+        return self._version
 
     def add_resource(self, resource: Resource) -> Resource:
         """Add a resource to the manager.
@@ -44,6 +50,7 @@ class ResourceManager:
                 logger.warning(f"Resource already exists: {resource.uri}")
             return existing
         self._resources[str(resource.uri)] = resource
+        self._version += 1
         return resource
 
     def add_template(
@@ -65,6 +72,7 @@ class ResourceManager:
             mime_type=mime_type,
         )
         self._templates[template.uri_template] = template
+        self._version += 1
         return template
 
     async def get_resource(self, uri: AnyUrl | str) -> Resource | None:
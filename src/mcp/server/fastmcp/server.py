@@ -3,46 +3,55 @@
 from __future__ import annotations as _annotations
 
 import inspect
+import os
 import re
 from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Sequence
 from contextlib import (
     AbstractAsyncContextManager,
     asynccontextmanager,
 )
-from itertools import chain
-from typing import Any, Generic, Literal
+from functools import lru_cache, partial
+from typing import Any, Generic, Literal, TypeVar
 
 import anyio
+import anyio.to_thread
 import pydantic_core
-from pydantic import BaseModel, Field
+from pydantic import AnyHttpUrl, Field
 from pydantic.networks import AnyUrl
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from starlette.applications import Starlette
 from starlette.middleware import Middleware
-from starlette.middleware.authentication import AuthenticationMiddleware
 from starlette.requests import Request
 from starlette.responses import Response
 from starlette.routing import Mount, Route
 from starlette.types import Receive, Scope, Send
 
-from mcp.server.auth.middleware.auth_context import AuthContextMiddleware
+from mcp.server.auth.middleware.auth_context import BearerAuthContextMiddleware
 from mcp.server.auth.middleware.bearer_auth import (
     BearerAuthBackend,
     RequireAuthMiddleware,
 )
-from mcp.server.auth.provider import OAuthAuthorizationServerProvider, ProviderTokenVerifier, TokenVerifier
+from mcp.server.auth.provider import (
+    CachingTokenVerifier,
+    OAuthAuthorizationServerProvider,
+    ProviderTokenVerifier,
+    TokenVerifier,
+)
+from mcp.server.auth.routes import create_auth_routes, create_protected_resource_routes
 from mcp.server.auth.settings import AuthSettings
 from mcp.server.elicitation import ElicitationResult, ElicitSchemaModelT, elicit_with_validation
 from mcp.server.fastmcp.exceptions import ResourceError
 from mcp.server.fastmcp.prompts import Prompt, PromptManager
-from mcp.server.fastmcp.resources import FunctionResource, Resource, ResourceManager
+from mcp.server.fastmcp.resources import FunctionResource, Resource, ResourceManager, ResourceTemplate
 from mcp.server.fastmcp.tools import Tool, ToolManager
 from mcp.server.fastmcp.utilities.logging import configure_logging, get_logger
+from mcp.server.fastmcp.utilities.routing import CompiledRouter
 from mcp.server.fastmcp.utilities.types import Image
 from mcp.server.lowlevel.helper_types import ReadResourceContents
 from mcp.server.lowlevel.server import LifespanResultT
 from mcp.server.lowlevel.server import Server as MCPServer
 from mcp.server.lowlevel.server import lifespan as default_lifespan
+from mcp.server.models import InitializationOptions
 from mcp.server.session import ServerSession, ServerSessionT
 from mcp.server.sse import SseServerTransport
 from mcp.server.stdio import stdio_server
@@ -54,6 +63,8 @@ from mcp.types import (
     AnyFunction,
     ContentBlock,
     GetPromptResult,
+    ProgressToken,
+    PromptMessage,
     TextContent,
     ToolAnnotations,
 )
@@ -65,6 +76,14 @@ from mcp.types import Tool as MCPTool
 
 logger = get_logger(__name__)
 
+_URI_PARAM_RE = re.compile(r"{(\w+)}")
+
+# list_* payloads for registries larger than this are built in a worker thread
+_PAYLOAD_THREAD_THRESHOLD = 64
+
+_ItemT = TypeVar("_ItemT")
+_PayloadT = TypeVar("_PayloadT")
+
 
 class Settings(BaseSettings, Generic[LifespanResultT]):
     """FastMCP server settings.
@@ -121,19 +140,77 @@ class Settings(BaseSettings, Generic[LifespanResultT]):
     transport_security: TransportSecuritySettings | None = None
 
 
-def lifespan_wrapper(
-    app: FastMCP,
-    lifespan: Callable[[FastMCP], AbstractAsyncContextManager[LifespanResultT]],
-) -> Callable[[MCPServer[LifespanResultT, Request]], AbstractAsyncContextManager[object]]:
-    @asynccontextmanager
-    async def wrap(s: MCPServer[LifespanResultT, Request]) -> AsyncIterator[object]:
-        async with lifespan(app) as context:
-            yield context
+_default_settings_cache: tuple[tuple[Any, ...], Settings[Any]] | None = None
+
+
+def _default_settings() -> Settings[Any]:
+    """Return a private copy of the default settings.
 
-    return wrap
+    Parsing settings from the environment and .env file is comparatively slow,
+    so the parsed defaults are reused until the working directory, any
+    FASTMCP_ environment variable or the .env file changes. Each caller gets
+    its own deep copy because servers mutate their settings (e.g. mount_path).
+    """
+    global _default_settings_cache
+    try:
+        env_file = os.stat(".env")
+        env_file_stamp: tuple[int, int] | None = (env_file.st_mtime_ns, env_file.st_size)
+    except OSError:
+        env_file_stamp = None
+    key = (
+        os.getcwd(),
+        env_file_stamp,
+        tuple(sorted((k, v) for k, v in os.environ.items() if k.upper().startswith("FASTMCP_"))),
+    )
+    if _default_settings_cache is None or _default_settings_cache[0] != key:
+        _default_settings_cache = (key, Settings())
+    return _default_settings_cache[1].model_copy(deep=True)
+
+
+@lru_cache(maxsize=16)
+def _join_mount_path(mount_path: str, endpoint: str) -> str:
+    # Special case: root path
+    if mount_path == "/":
+        return endpoint
+    # Drop the mount path's trailing slash and ensure exactly one separator
+    return f"{mount_path.removesuffix('/')}/{endpoint.removeprefix('/')}"
 
 
 class FastMCP:
+    # Instance state lives in slots; __dict__ is kept so that subclasses,
+    # cached properties and instance-level patching keep working.
+    __slots__ = (
+        "settings",
+        "_user_lifespan",
+        "_mcp_server",
+        "_tool_manager",
+        "_resource_manager",
+        "_prompt_manager",
+        "_auth_server_provider",
+        "_token_verifier",
+        "_resource_metadata_url",
+        "_required_scopes",
+        "_event_store",
+        "_custom_starlette_routes",
+        "dependencies",
+        "_session_manager",
+        "_init_options",
+        "_tools_cache",
+        "_resources_cache",
+        "_resource_templates_cache",
+        "_prompts_cache",
+        "_sse_transport",
+        "_sse_transport_key",
+        "_sse_routes",
+        "_auth_middleware",
+        "_auth_routes",
+        "_sse_app",
+        "_streamable_http_app",
+        "_asgi_app",
+        "__dict__",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         name: str | None = None,
@@ -145,12 +222,13 @@ class FastMCP:
         tools: list[Tool] | None = None,
         **settings: Any,
     ):
-        self.settings = Settings(**settings)
+        self.settings = Settings(**settings) if settings else _default_settings()
+        self._user_lifespan = self.settings.lifespan
 
         self._mcp_server = MCPServer(
             name=name or "FastMCP",
             instructions=instructions,
-            lifespan=(lifespan_wrapper(self, self.settings.lifespan) if self.settings.lifespan else default_lifespan),
+            lifespan=self._dispatch_lifespan if self._user_lifespan else default_lifespan,
         )
         self._tool_manager = ToolManager(tools=tools, warn_on_duplicate_tools=self.settings.warn_on_duplicate_tools)
         self._resource_manager = ResourceManager(warn_on_duplicate_resources=self.settings.warn_on_duplicate_resources)
@@ -171,17 +249,60 @@ class FastMCP:
         # Create token verifier from provider if needed (backwards compatibility)
         if auth_server_provider and not token_verifier:
             self._token_verifier = ProviderTokenVerifier(auth_server_provider)
+
+        # Determine resource metadata URL
+        self._resource_metadata_url: AnyHttpUrl | None = None
+        if self.settings.auth and self.settings.auth.resource_server_url:
+            self._resource_metadata_url = AnyHttpUrl(
+                str(self.settings.auth.resource_server_url).rstrip("/") + "/.well-known/oauth-protected-resource"
+            )
+
+        # Scopes every token must carry to reach the MCP endpoints, in settings order
+        self._required_scopes: tuple[str, ...] = ()
+        if self.settings.auth:
+            self._required_scopes = tuple(self.settings.auth.required_scopes or ())
+
         self._event_store = event_store
         self._custom_starlette_routes: list[Route] = []
         self.dependencies = self.settings.dependencies
         self._session_manager: StreamableHTTPSessionManager | None = None
 
+        # Initialization options, keyed by the registered request handler types
+        self._init_options: tuple[frozenset[type], InitializationOptions] | None = None
+
+        # Cached list_* payloads, keyed by the owning manager's version
+        self._tools_cache: tuple[int, list[MCPTool]] | None = None
+        self._resources_cache: tuple[int, list[MCPResource]] | None = None
+        self._resource_templates_cache: tuple[int, list[MCPResourceTemplate]] | None = None
+        self._prompts_cache: tuple[int, list[MCPPrompt]] | None = None
+
+        # SSE transport and routes, built lazily on the first sse_app() call
+        self._sse_transport: SseServerTransport | None = None
+        self._sse_transport_key: tuple[str, str] | None = None
+        self._sse_routes: tuple[SseServerTransport, list[Route | Mount]] | None = None
+
+        # Auth middleware and routes, shared by sse_app() and streamable_http_app()
+        self._auth_middleware: list[Middleware] | None = None
+        self._auth_routes: list[Route] | None = None
+
+        # Starlette apps, reset whenever a custom route is registered
+        self._sse_app: tuple[list[Route | Mount], Starlette] | None = None
+        self._streamable_http_app: Starlette | None = None
+        self._asgi_app: tuple[list[Route | Mount], Starlette] | None = None
+
         # Set up MCP protocol handlers
         self._setup_handlers()
 
         # Configure logging
         configure_logging(self.settings.log_level)
 
+    @asynccontextmanager
+    async def _dispatch_lifespan(self, server: MCPServer[Any, Request]) -> AsyncIterator[object]:
+        """Run the user-supplied lifespan, passing this FastMCP instance."""
+        assert self._user_lifespan is not None
+        async with self._user_lifespan(self) as context:
+            yield context
+
     @property
     def name(self) -> str:
         return self._mcp_server.name
@@ -220,10 +341,6 @@ class FastMCP:
             transport: Transport protocol to use ("stdio", "sse", or "streamable-http")
             mount_path: Optional mount path for SSE transport
         """
-        TRANSPORTS = Literal["stdio", "sse", "streamable-http"]
-        if transport not in TRANSPORTS.__args__:  # type: ignore
-            raise ValueError(f"Unknown transport: {transport}")
-
         match transport:
             case "stdio":
                 anyio.run(self.run_stdio_async)
@@ -231,6 +348,20 @@ class FastMCP:
                 anyio.run(lambda: self.run_sse_async(mount_path))
             case "streamable-http":
                 anyio.run(self.run_streamable_http_async)
+            case _:
+                raise ValueError(f"Unknown transport: {transport}")
+
+    def _get_initialization_options(self) -> InitializationOptions:
+        """Return the server's initialization options.
+
+        Capabilities are derived from the registered request handlers, so the
+        options are only rebuilt when that set changes (e.g. after registering a
+        completion handler).
+        """
+        handler_types = frozenset(self._mcp_server.request_handlers)
+        if self._init_options is None or self._init_options[0] != handler_types:
+            self._init_options = (handler_types, self._mcp_server.create_initialization_options())
+        return self._init_options[1]
 
     def _setup_handlers(self) -> None:
         """Set up core MCP protocol handlers."""
@@ -244,17 +375,14 @@ class FastMCP:
 
     async def list_tools(self) -> list[MCPTool]:
         """List all available tools."""
+        version = self._tool_manager.version
+        if self._tools_cache is not None and self._tools_cache[0] == version:
+            return self._tools_cache[1]
+
         tools = self._tool_manager.list_tools()
-        return [
-            MCPTool(
-                name=info.name,
-                title=info.title,
-                description=info.description,
-                inputSchema=info.parameters,
-                annotations=info.annotations,
-            )
-            for info in tools
-        ]
+        mcp_tools = await _build_payload(_to_mcp_tools, tools)
+        self._tools_cache = (version, mcp_tools)
+        return mcp_tools
 
     def get_context(self) -> Context[ServerSession, object, Request]:
         """
@@ -271,35 +399,32 @@ class FastMCP:
         """Call a tool by name with arguments."""
         context = self.get_context()
         result = await self._tool_manager.call_tool(name, arguments, context=context)
+        # Plain strings are the most common result and need no conversion or validation
+        if isinstance(result, str):
+            return [TextContent.model_construct(type="text", text=result)]
         converted_result = _convert_to_content(result)
         return converted_result
 
     async def list_resources(self) -> list[MCPResource]:
         """List all available resources."""
+        version = self._resource_manager.version
+        if self._resources_cache is not None and self._resources_cache[0] == version:
+            return self._resources_cache[1]
 
         resources = self._resource_manager.list_resources()
-        return [
-            MCPResource(
-                uri=resource.uri,
-                name=resource.name or "",
-                title=resource.title,
-                description=resource.description,
-                mimeType=resource.mime_type,
-            )
-            for resource in resources
-        ]
+        mcp_resources = await _build_payload(_to_mcp_resources, resources)
+        self._resources_cache = (version, mcp_resources)
+        return mcp_resources
 
     async def list_resource_templates(self) -> list[MCPResourceTemplate]:
+        version = self._resource_manager.version
+        if self._resource_templates_cache is not None and self._resource_templates_cache[0] == version:
+            return self._resource_templates_cache[1]
+
         templates = self._resource_manager.list_templates()
-        return [
-            MCPResourceTemplate(
-                uriTemplate=template.uri_template,
-                name=template.name,
-                title=template.title,
-                description=template.description,
-            )
-            for template in templates
-        ]
+        mcp_templates = await _build_payload(_to_mcp_resource_templates, templates)
+        self._resource_templates_cache = (version, mcp_templates)
+        return mcp_templates
 
     async def read_resource(self, uri: AnyUrl | str) -> Iterable[ReadResourceContents]:
         """Read a resource by URI."""
@@ -465,12 +590,14 @@ class FastMCP:
         def decorator(fn: AnyFunction) -> AnyFunction:
             # Check if this should be a template
             has_uri_params = "{" in uri and "}" in uri
-            has_func_params = bool(inspect.signature(fn).parameters)
+            fn_params = inspect.signature(fn).parameters
+            has_func_params = bool(fn_params)
 
             if has_uri_params or has_func_params:
-                # Validate that URI params match function params
-                uri_params = set(re.findall(r"{(\w+)}", uri))
-                func_params = set(inspect.signature(fn).parameters.keys())
+                # Validate that URI params match function params; a URI without
+                # braces cannot contain params, so skip the regex scan for it
+                uri_params: set[str] = set(_URI_PARAM_RE.findall(uri)) if has_uri_params else set()
+                func_params = set(fn_params.keys())
 
                 if uri_params != func_params:
                     raise ValueError(
@@ -600,6 +727,9 @@ class FastMCP:
                     include_in_schema=include_in_schema,
                 )
             )
+            self._sse_app = None
+            self._streamable_http_app = None
+            self._asgi_app = None
             return func
 
         return decorator
@@ -610,7 +740,7 @@ class FastMCP:
             await self._mcp_server.run(
                 read_stream,
                 write_stream,
-                self._mcp_server.create_initialization_options(),
+                self._get_initialization_options(),
             )
 
     async def run_sse_async(self, mount_path: str | None = None) -> None:
@@ -643,7 +773,8 @@ class FastMCP:
         server = uvicorn.Server(config)
         await server.serve()
 
-    def _normalize_path(self, mount_path: str, endpoint: str) -> str:
+    @staticmethod
+    def _normalize_path(mount_path: str, endpoint: str) -> str:
         """
         Combine mount path and endpoint to return a normalized path.
 
@@ -654,127 +785,131 @@ class FastMCP:
         Returns:
             Normalized path (e.g. "/github/messages/")
         """
-        # Special case: root path
-        if mount_path == "/":
-            return endpoint
-
-        # Remove trailing slash from mount path
-        if mount_path.endswith("/"):
-            mount_path = mount_path[:-1]
+        return _join_mount_path(mount_path, endpoint)
 
-        # Ensure endpoint starts with slash
-        if not endpoint.startswith("/"):
-            endpoint = "/" + endpoint
+    def _get_sse_transport(self) -> SseServerTransport:
+        """Return the SSE transport for the current mount and message paths.
 
-        # Combine paths
-        return mount_path + endpoint
+        The transport is created on first use and rebuilt only if either path
+        has changed since.
+        """
+        key = (self.settings.mount_path, self.settings.message_path)
+        if self._sse_transport is None or self._sse_transport_key != key:
+            # Create normalized endpoint considering the mount path
+            normalized_message_endpoint = self._normalize_path(*key)
+            self._sse_transport = SseServerTransport(
+                normalized_message_endpoint,
+                security_settings=self.settings.transport_security,
+            )
+            self._sse_transport_key = key
+        return self._sse_transport
+
+    def _get_auth_middleware(self) -> list[Middleware]:
+        """Return the auth middleware shared by the HTTP apps, building it on first use."""
+        if self._auth_middleware is None:
+            self._auth_middleware = []
+            # Add auth middleware if auth is configured and a token verifier is available
+            if self.settings.auth and self._token_verifier:
+                token_verifier = self._token_verifier
+                # Cache results of external verifiers, which may need network or crypto
+                # work per token. Provider-backed verification is local and must observe
+                # revocations immediately, so it is never cached.
+                ttl = self.settings.auth.token_cache_ttl_seconds
+                if ttl > 0 and not isinstance(token_verifier, ProviderTokenVerifier):
+                    token_verifier = CachingTokenVerifier(token_verifier, ttl_seconds=ttl)
+                self._auth_middleware = [
+                    # extract auth info from request (but do not require it) and
+                    # store the authenticated user in a contextvar
+                    Middleware(
+                        BearerAuthContextMiddleware,
+                        backend=BearerAuthBackend(token_verifier),
+                    ),
+                ]
+        return self._auth_middleware
 
-    def sse_app(self, mount_path: str | None = None) -> Starlette:
-        """Return an instance of the SSE server app."""
-        from starlette.middleware import Middleware
-        from starlette.routing import Mount, Route
+    def _get_auth_routes(self) -> list[Route]:
+        """Return the authorization server routes, building them on first use."""
+        if self._auth_routes is None:
+            self._auth_routes = []
+            # Add auth endpoints if auth server provider is configured
+            if self.settings.auth and self._auth_server_provider:
+                self._auth_routes = create_auth_routes(
+                    provider=self._auth_server_provider,
+                    issuer_url=self.settings.auth.issuer_url,
+                    service_documentation_url=self.settings.auth.service_documentation_url,
+                    client_registration_options=self.settings.auth.client_registration_options,
+                    revocation_options=self.settings.auth.revocation_options,
+                )
+        return self._auth_routes
+
+    def _get_protected_resource_routes(self) -> list[Route]:
+        """Return the protected resource metadata routes, if configured as a resource server."""
+        if not (self.settings.auth and self.settings.auth.resource_server_url):
+            return []
+        return create_protected_resource_routes(
+            resource_url=self.settings.auth.resource_server_url,
+            authorization_servers=[self.settings.auth.issuer_url],
+            scopes_supported=self.settings.auth.required_scopes,
+        )
 
-        # Update mount_path in settings if provided
-        if mount_path is not None:
-            self.settings.mount_path = mount_path
+    async def _handle_sse(self, sse: SseServerTransport, scope: Scope, receive: Receive, send: Send) -> Response:
+        """ASGI handler for a single SSE connection on the given transport."""
+        async with sse.connect_sse(
+            scope,
+            receive,
+            send,
+        ) as streams:
+            await self._mcp_server.run(
+                streams[0],
+                streams[1],
+                self._get_initialization_options(),
+            )
+        return Response()
 
-        # Create normalized endpoint considering the mount path
-        normalized_message_endpoint = self._normalize_path(self.settings.mount_path, self.settings.message_path)
+    async def _sse_endpoint(self, sse: SseServerTransport, request: Request) -> Response:
+        """Starlette endpoint adapting a request to the SSE ASGI handler."""
+        # Convert the Starlette request to ASGI parameters
+        return await self._handle_sse(sse, request.scope, request.receive, request._send)  # type: ignore[reportPrivateUsage]
 
-        # Set up auth context and dependencies
+    def _get_sse_routes(self) -> list[Route | Mount]:
+        """Return the SSE app's routes, excluding custom routes.
 
-        sse = SseServerTransport(
-            normalized_message_endpoint,
-            security_settings=self.settings.transport_security,
-        )
+        The routes are built once per SSE transport, i.e. rebuilt only when the
+        mount or message path changes.
+        """
+        sse = self._get_sse_transport()
+        if self._sse_routes is not None and self._sse_routes[0] is sse:
+            return self._sse_routes[1]
 
-        async def handle_sse(scope: Scope, receive: Receive, send: Send):
-            # Add client ID from auth context into request context if available
-
-            async with sse.connect_sse(
-                scope,
-                receive,
-                send,
-            ) as streams:
-                await self._mcp_server.run(
-                    streams[0],
-                    streams[1],
-                    self._mcp_server.create_initialization_options(),
-                )
-            return Response()
+        handle_sse = partial(self._handle_sse, sse)
 
         # Create routes
-        routes: list[Route | Mount] = []
-        middleware: list[Middleware] = []
-        required_scopes = []
-
-        # Set up auth if configured
-        if self.settings.auth:
-            required_scopes = self.settings.auth.required_scopes or []
-
-            # Add auth middleware if token verifier is available
-            if self._token_verifier:
-                middleware = [
-                    # extract auth info from request (but do not require it)
-                    Middleware(
-                        AuthenticationMiddleware,
-                        backend=BearerAuthBackend(self._token_verifier),
-                    ),
-                    # Add the auth context middleware to store
-                    # authenticated user in a contextvar
-                    Middleware(AuthContextMiddleware),
-                ]
-
-            # Add auth endpoints if auth server provider is configured
-            if self._auth_server_provider:
-                from mcp.server.auth.routes import create_auth_routes
-
-                routes.extend(
-                    create_auth_routes(
-                        provider=self._auth_server_provider,
-                        issuer_url=self.settings.auth.issuer_url,
-                        service_documentation_url=self.settings.auth.service_documentation_url,
-                        client_registration_options=self.settings.auth.client_registration_options,
-                        revocation_options=self.settings.auth.revocation_options,
-                    )
-                )
+        routes: list[Route | Mount] = [*self._get_auth_routes()]
+        required_scopes = self._required_scopes
 
         # When auth is configured, require authentication
         if self._token_verifier:
-            # Determine resource metadata URL
-            resource_metadata_url = None
-            if self.settings.auth and self.settings.auth.resource_server_url:
-                from pydantic import AnyHttpUrl
-
-                resource_metadata_url = AnyHttpUrl(
-                    str(self.settings.auth.resource_server_url).rstrip("/") + "/.well-known/oauth-protected-resource"
-                )
-
             # Auth is enabled, wrap the endpoints with RequireAuthMiddleware
             routes.append(
                 Route(
                     self.settings.sse_path,
-                    endpoint=RequireAuthMiddleware(handle_sse, required_scopes, resource_metadata_url),
+                    endpoint=RequireAuthMiddleware(handle_sse, required_scopes, self._resource_metadata_url),
                     methods=["GET"],
                 )
             )
             routes.append(
                 Mount(
                     self.settings.message_path,
-                    app=RequireAuthMiddleware(sse.handle_post_message, required_scopes, resource_metadata_url),
+                    app=RequireAuthMiddleware(sse.handle_post_message, required_scopes, self._resource_metadata_url),
                 )
             )
         else:
             # Auth is disabled, no need for RequireAuthMiddleware
-            # Since handle_sse is an ASGI app, we need to create a compatible endpoint
-            async def sse_endpoint(request: Request) -> Response:
-                # Convert the Starlette request to ASGI parameters
-                return await handle_sse(request.scope, request.receive, request._send)  # type: ignore[reportPrivateUsage]
-
+            # Since handle_sse is an ASGI app, we need a request/response compatible endpoint
             routes.append(
                 Route(
                     self.settings.sse_path,
-                    endpoint=sse_endpoint,
+                    endpoint=partial(self._sse_endpoint, sse),
                     methods=["GET"],
                 )
             )
@@ -784,32 +919,40 @@ class FastMCP:
                     app=sse.handle_post_message,
                 )
             )
-        # Add protected resource metadata endpoint if configured as RS
-        if self.settings.auth and self.settings.auth.resource_server_url:
-            from mcp.server.auth.routes import create_protected_resource_routes
+        routes.extend(self._get_protected_resource_routes())
 
-            routes.extend(
-                create_protected_resource_routes(
-                    resource_url=self.settings.auth.resource_server_url,
-                    authorization_servers=[self.settings.auth.issuer_url],
-                    scopes_supported=self.settings.auth.required_scopes,
-                )
-            )
+        self._sse_routes = (sse, routes)
+        return routes
+
+    def sse_app(self, mount_path: str | None = None) -> Starlette:
+        """Return an instance of the SSE server app."""
+        # Update mount_path in settings if provided
+        if mount_path is not None:
+            self.settings.mount_path = mount_path
+
+        sse_routes = self._get_sse_routes()
+        if self._sse_app is not None and self._sse_app[0] is sse_routes:
+            return self._sse_app[1]
 
-        # mount these routes last, so they have the lowest route matching precedence
-        routes.extend(self._custom_starlette_routes)
+        # mount custom routes last, so they have the lowest route matching precedence
+        routes = [*sse_routes, *self._custom_starlette_routes]
 
         # Create Starlette app with routes and middleware
-        return Starlette(debug=self.settings.debug, routes=routes, middleware=middleware)
+        app = Starlette(debug=self.settings.debug, middleware=self._get_auth_middleware())
+        app.router = CompiledRouter(routes)
+        self._sse_app = (sse_routes, app)
+        return app
 
-    def streamable_http_app(self) -> Starlette:
-        """Return an instance of the StreamableHTTP server app."""
-        from starlette.middleware import Middleware
-        from starlette.routing import Mount
+    def _run_session_manager(self, app: Starlette) -> AbstractAsyncContextManager[None]:
+        """Lifespan of the StreamableHTTP app, which runs the session manager."""
+        return self.session_manager.run()
 
+    def _get_streamable_http_mount(self) -> Mount:
+        """Return the StreamableHTTP endpoint, creating the session manager on first use."""
         # Create session manager on first call (lazy initialization)
-        if self._session_manager is None:
-            self._session_manager = StreamableHTTPSessionManager(
+        session_manager = self._session_manager
+        if session_manager is None:
+            session_manager = self._session_manager = StreamableHTTPSessionManager(
                 app=self._mcp_server,
                 event_store=self._event_store,
                 json_response=self.settings.json_response,
@@ -817,154 +960,188 @@ class FastMCP:
                 security_settings=self.settings.transport_security,
             )
 
-        # Create the ASGI handler
-        async def handle_streamable_http(scope: Scope, receive: Receive, send: Send) -> None:
-            await self.session_manager.handle_request(scope, receive, send)
-
-        # Create routes
-        routes: list[Route | Mount] = []
-        middleware: list[Middleware] = []
-        required_scopes = []
-
-        # Set up auth if configured
-        if self.settings.auth:
-            required_scopes = self.settings.auth.required_scopes or []
-
-            # Add auth middleware if token verifier is available
-            if self._token_verifier:
-                middleware = [
-                    Middleware(
-                        AuthenticationMiddleware,
-                        backend=BearerAuthBackend(self._token_verifier),
-                    ),
-                    Middleware(AuthContextMiddleware),
-                ]
-
-            # Add auth endpoints if auth server provider is configured
-            if self._auth_server_provider:
-                from mcp.server.auth.routes import create_auth_routes
-
-                routes.extend(
-                    create_auth_routes(
-                        provider=self._auth_server_provider,
-                        issuer_url=self.settings.auth.issuer_url,
-                        service_documentation_url=self.settings.auth.service_documentation_url,
-                        client_registration_options=self.settings.auth.client_registration_options,
-                        revocation_options=self.settings.auth.revocation_options,
-                    )
-                )
+        # The session manager's request handler is the ASGI app; binding it here skips
+        # a wrapper frame and the session_manager property check on every request
+        handle_streamable_http = session_manager.handle_request
 
-        # Set up routes with or without auth
+        # Set up the endpoint with or without auth
         if self._token_verifier:
-            # Determine resource metadata URL
-            resource_metadata_url = None
-            if self.settings.auth and self.settings.auth.resource_server_url:
-                from pydantic import AnyHttpUrl
+            return Mount(
+                self.settings.streamable_http_path,
+                app=RequireAuthMiddleware(handle_streamable_http, self._required_scopes, self._resource_metadata_url),
+            )
+        # Auth is disabled, no wrapper needed
+        return Mount(self.settings.streamable_http_path, app=handle_streamable_http)
 
-                resource_metadata_url = AnyHttpUrl(
-                    str(self.settings.auth.resource_server_url).rstrip("/") + "/.well-known/oauth-protected-resource"
-                )
+    def streamable_http_app(self) -> Starlette:
+        """Return an instance of the StreamableHTTP server app.
 
-            routes.append(
-                Mount(
-                    self.settings.streamable_http_path,
-                    app=RequireAuthMiddleware(handle_streamable_http, required_scopes, resource_metadata_url),
-                )
-            )
-        else:
-            # Auth is disabled, no wrapper needed
-            routes.append(
-                Mount(
-                    self.settings.streamable_http_path,
-                    app=handle_streamable_http,
-                )
-            )
+        The app is built once and reused until a custom route is registered.
+        """
+        if self._streamable_http_app is not None:
+            return self._streamable_http_app
+
+        routes: list[Route | Mount] = [
+            *self._get_auth_routes(),
+            self._get_streamable_http_mount(),
+            *self._get_protected_resource_routes(),
+            *self._custom_starlette_routes,
+        ]
 
-        # Add protected resource metadata endpoint if configured as RS
-        if self.settings.auth and self.settings.auth.resource_server_url:
-            from mcp.server.auth.handlers.metadata import ProtectedResourceMetadataHandler
-            from mcp.server.auth.routes import cors_middleware
-            from mcp.shared.auth import ProtectedResourceMetadata
-
-            protected_resource_metadata = ProtectedResourceMetadata(
-                resource=self.settings.auth.resource_server_url,
-                authorization_servers=[self.settings.auth.issuer_url],
-                scopes_supported=self.settings.auth.required_scopes,
-            )
-            routes.append(
-                Route(
-                    "/.well-known/oauth-protected-resource",
-                    endpoint=cors_middleware(
-                        ProtectedResourceMetadataHandler(protected_resource_metadata).handle,
-                        ["GET", "OPTIONS"],
-                    ),
-                    methods=["GET", "OPTIONS"],
-                )
-            )
+        app = Starlette(debug=self.settings.debug, middleware=self._get_auth_middleware())
+        app.router = CompiledRouter(routes, lifespan=self._run_session_manager)
+        self._streamable_http_app = app
+        return app
 
-        routes.extend(self._custom_starlette_routes)
+    def asgi_app(self) -> Starlette:
+        """Return a single app serving both the StreamableHTTP and SSE transports.
 
-        return Starlette(
-            debug=self.settings.debug,
-            routes=routes,
-            middleware=middleware,
-            lifespan=lambda app: self.session_manager.run(),
-        )
+        The transports share one middleware stack and one copy of the auth,
+        metadata and custom routes, instead of each app building its own. The app
+        is built once and reused until a custom route is registered or the SSE
+        mount path changes.
+        """
+        sse_routes = self._get_sse_routes()
+        if self._asgi_app is not None and self._asgi_app[0] is sse_routes:
+            return self._asgi_app[1]
+
+        # sse_routes already include the auth and metadata routes
+        routes: list[Route | Mount] = [
+            *sse_routes,
+            self._get_streamable_http_mount(),
+            *self._custom_starlette_routes,
+        ]
+
+        app = Starlette(debug=self.settings.debug, middleware=self._get_auth_middleware())
+        app.router = CompiledRouter(routes, lifespan=self._run_session_manager)
+        self._asgi_app = (sse_routes, app)
+        return app
 
     async def list_prompts(self) -> list[MCPPrompt]:
         """List all available prompts."""
+        version = self._prompt_manager.version
+        if self._prompts_cache is not None and self._prompts_cache[0] == version:
+            return self._prompts_cache[1]
+
         prompts = self._prompt_manager.list_prompts()
-        return [
-            MCPPrompt(
-                name=prompt.name,
-                title=prompt.title,
-                description=prompt.description,
-                arguments=[
-                    MCPPromptArgument(
-                        name=arg.name,
-                        description=arg.description,
-                        required=arg.required,
-                    )
-                    for arg in (prompt.arguments or [])
-                ],
-            )
-            for prompt in prompts
-        ]
+        mcp_prompts = await _build_payload(_to_mcp_prompts, prompts)
+        self._prompts_cache = (version, mcp_prompts)
+        return mcp_prompts
 
     async def get_prompt(self, name: str, arguments: dict[str, Any] | None = None) -> GetPromptResult:
         """Get a prompt by name with arguments."""
         try:
             messages = await self._prompt_manager.render_prompt(name, arguments)
 
-            return GetPromptResult(messages=pydantic_core.to_jsonable_python(messages))
+            # Rendered messages are already validated models; reuse their content blocks
+            # instead of round-tripping them through JSON-compatible dicts
+            return GetPromptResult(
+                messages=[PromptMessage(role=message.role, content=message.content) for message in messages]
+            )
         except Exception as e:
             logger.error(f"Error getting prompt {name}: {e}")
             raise ValueError(str(e))
 
 
+async def _build_payload(build: Callable[[list[_ItemT]], list[_PayloadT]], items: list[_ItemT]) -> list[_PayloadT]:
+    """Build a list_* response payload, off the event loop if it is large.
+
+    Building the payload is purely CPU-bound, so large registries are converted
+    in a worker thread to keep the event loop responsive for other requests.
+    """
+    if len(items) > _PAYLOAD_THREAD_THRESHOLD:
+        return await anyio.to_thread.run_sync(build, items)
+    return build(items)
+
+
+def _to_mcp_tools(tools: list[Tool]) -> list[MCPTool]:
+    # Tools were validated at registration time, so skip re-validation here
+    construct_tool = MCPTool.model_construct
+    return [
+        construct_tool(
+            name=info.name,
+            title=info.title,
+            description=info.description,
+            inputSchema=info.parameters,
+            annotations=info.annotations,
+        )
+        for info in tools
+    ]
+
+
+def _to_mcp_resources(resources: list[Resource]) -> list[MCPResource]:
+    construct_resource = MCPResource.model_construct
+    return [
+        construct_resource(
+            uri=resource.uri,
+            name=resource.name or "",
+            title=resource.title,
+            description=resource.description,
+            mimeType=resource.mime_type,
+        )
+        for resource in resources
+    ]
+
+
+def _to_mcp_resource_templates(templates: list[ResourceTemplate]) -> list[MCPResourceTemplate]:
+    construct_template = MCPResourceTemplate.model_construct
+    return [
+        construct_template(
+            uriTemplate=template.uri_template,
+            name=template.name,
+            title=template.title,
+            description=template.description,
+        )
+        for template in templates
+    ]
+
+
+def _to_mcp_prompts(prompts: list[Prompt]) -> list[MCPPrompt]:
+    return [
+        MCPPrompt(
+            name=prompt.name,
+            title=prompt.title,
+            description=prompt.description,
+            arguments=[
+                MCPPromptArgument(
+                    name=arg.name,
+                    description=arg.description,
+                    required=arg.required,
+                )
+                for arg in (prompt.arguments or [])
+            ],
+        )
+        for prompt in prompts
+    ]
+
+
 def _convert_to_content(
     result: Any,
 ) -> Sequence[ContentBlock]:
     """Convert a result to a sequence of content objects."""
-    if result is None:
-        return []
-
-    if isinstance(result, ContentBlock):
-        return [result]
-
-    if isinstance(result, Image):
-        return [result.to_image_content()]
-
-    if isinstance(result, list | tuple):
-        return list(chain.from_iterable(_convert_to_content(item) for item in result))  # type: ignore[reportUnknownVariableType]
-
-    if not isinstance(result, str):
-        result = pydantic_core.to_json(result, fallback=str, indent=2).decode()
+    content: list[ContentBlock] = []
+    # Flatten nested lists and tuples in order with an explicit stack
+    stack: list[Any] = [result]
+    while stack:
+        item = stack.pop()
+        if item is None:
+            continue
+
+        if isinstance(item, ContentBlock):
+            content.append(item)
+        elif isinstance(item, Image):
+            content.append(item.to_image_content())
+        elif isinstance(item, list | tuple):
+            stack.extend(reversed(item))  # type: ignore[reportUnknownArgumentType]
+        else:
+            if not isinstance(item, str):
+                item = pydantic_core.to_json(item, fallback=str, indent=2).decode()
+            content.append(TextContent(type="text", text=item))
 
-    return [TextContent(type="text", text=result)]
+    return content
 
 
-class Context(BaseModel, Generic[ServerSessionT, LifespanContextT, RequestT]):
+class Context(Generic[ServerSessionT, LifespanContextT, RequestT]):
     """Context object providing access to MCP capabilities.
 
     This provides a cleaner interface to MCP's RequestContext functionality.
@@ -998,8 +1175,13 @@ class Context(BaseModel, Generic[ServerSessionT, LifespanContextT, RequestT]):
     The context is optional - tools that don't need it can omit the parameter.
     """
 
+    # A context is created for every tool call, so keep it a plain slotted object
+    __slots__ = ("_request_context", "_fastmcp", "_request_id", "_progress_token")
+
     _request_context: RequestContext[ServerSessionT, LifespanContextT, RequestT] | None
     _fastmcp: FastMCP | None
+    _request_id: str | None
+    _progress_token: ProgressToken | None
 
     def __init__(
         self,
@@ -1008,9 +1190,13 @@ class Context(BaseModel, Generic[ServerSessionT, LifespanContextT, RequestT]):
         fastmcp: FastMCP | None = None,
         **kwargs: Any,
     ):
-        super().__init__(**kwargs)
         self._request_context = request_context
         self._fastmcp = fastmcp
+        # Stringified request ID, computed on first use; the request context never changes
+        self._request_id = None
+        # Resolved up front so report_progress can return early when the client sent no token
+        meta = request_context.meta if request_context is not None else None
+        self._progress_token = meta.progressToken if meta is not None else None
 
     @property
     def fastmcp(self) -> FastMCP:
@@ -1036,9 +1222,10 @@ class Context(BaseModel, Generic[ServerSessionT, LifespanContextT, RequestT]):
             total: Optional total value e.g. 100
             message: Optional message e.g. Starting render...
         """
-        progress_token = self.request_context.meta.progressToken if self.request_context.meta else None
-
+        progress_token = self._progress_token
         if progress_token is None:
+            if self._request_context is None:
+                raise ValueError("Context is not available outside of a request")
             return
 
         await self.request_context.session.send_progress_notification(
@@ -1057,8 +1244,7 @@ class Context(BaseModel, Generic[ServerSessionT, LifespanContextT, RequestT]):
         Returns:
             The resource content as either text or bytes
         """
-        assert self._fastmcp is not None, "Context is not available outside of a request"
-        return await self._fastmcp.read_resource(uri)
+        return await self.fastmcp.read_resource(uri)
 
     async def elicit(
         self,
@@ -1104,7 +1290,6 @@ class Context(BaseModel, Generic[ServerSessionT, LifespanContextT, RequestT]):
             level: Log level (debug, info, warning, error)
             message: Log message
             logger_name: Optional logger name
-            **extra: Additional structured data to include
         """
         await self.request_context.session.send_log_message(
             level=level,
@@ -1116,31 +1301,47 @@ class Context(BaseModel, Generic[ServerSessionT, LifespanContextT, RequestT]):
     @property
     def client_id(self) -> str | None:
         """Get the client ID if available."""
-        return getattr(self.request_context.meta, "client_id", None) if self.request_context.meta else None
+        meta = self.request_context.meta
+        if meta is None:
+            return None
+        # client_id is not a declared Meta field, so clients send it as an extra _meta entry;
+        # a dict lookup avoids getattr's AttributeError fallback when it is absent
+        extra = meta.model_extra
+        return extra.get("client_id") if extra else None
 
     @property
     def request_id(self) -> str:
         """Get the unique ID for this request."""
-        return str(self.request_context.request_id)
+        if self._request_id is None:
+            self._request_id = str(self.request_context.request_id)
+        return self._request_id
 
     @property
     def session(self):
         """Access to the underlying session for advanced usage."""
         return self.request_context.session
 
-    # Convenience methods for common log levels
-    async def debug(self, message: str, **extra: Any) -> None:
+    # Convenience methods for common log levels, sending directly to skip the log() hop
+    async def debug(self, message: str, *, logger_name: str | None = None) -> None:
         """Send a debug log message."""
-        await self.log("debug", message, **extra)
+        await self.request_context.session.send_log_message(
+            level="debug", data=message, logger=logger_name, related_request_id=self.request_id
+        )
 
-    async def info(self, message: str, **extra: Any) -> None:
+    async def info(self, message: str, *, logger_name: str | None = None) -> None:
         """Send an info log message."""
-        await self.log("info", message, **extra)
+        await self.request_context.session.send_log_message(
+            level="info", data=message, logger=logger_name, related_request_id=self.request_id
+        )
 
-    async def warning(self, message: str, **extra: Any) -> None:
+    async def warning(self, message: str, *, logger_name: str | None = None) -> None:
         """Send a warning log message."""
-        await self.log("warning", message, **extra)
+        await self.request_context.session.send_log_message(
+            level="warning", data=message, logger=logger_name, related_request_id=self.request_id
+        )
 
-    async def error(self, message: str, **extra: Any) -> None:
+    async def error(self, message: str, *, logger_name: str | None = None) -> None:
         """Send an error log message."""
-        await self.log("error", message, **extra)
+        await self.request_context.session.send_log_message(
+            level="error", data=message, logger=logger_name, related_request_id=self.request_id
+        )
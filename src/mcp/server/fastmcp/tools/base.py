@@ -2,8 +2,9 @@ from __future__ import annotations as _annotations
 
 import functools
 import inspect
+import types
 from collections.abc import Callable
-from typing import TYPE_CHECKING, Any, get_origin
+from typing import TYPE_CHECKING, Any, Union, get_args, get_origin
 
 from pydantic import BaseModel, Field
 
@@ -56,9 +57,7 @@ class Tool(BaseModel):
         if context_kwarg is None:
             sig = inspect.signature(fn)
             for param_name, param in sig.parameters.items():
-                if get_origin(param.annotation) is not None:
-                    continue
-                if issubclass(param.annotation, Context):
+                if _is_context_annotation(param.annotation, Context):
                     context_kwarg = param_name
                     break
 
@@ -97,6 +96,20 @@ class Tool(BaseModel):
             raise ToolError(f"Error executing tool {self.name}: {e}") from e
 
 
+def _is_context_annotation(annotation: Any, context_cls: type) -> bool:
+    """Check whether a parameter annotation asks for the request context.
+
+    Matches the context class itself, parametrized contexts such as
+    Context[ServerSession, None, Request] and optional contexts such as Context | None.
+    """
+    origin = get_origin(annotation)
+    if origin is Union or origin is types.UnionType:
+        return any(_is_context_annotation(arg, context_cls) for arg in get_args(annotation))
+    if origin is not None:
+        annotation = origin
+    return isinstance(annotation, type) and issubclass(annotation, context_cls)
+
+
 def _is_async_callable(obj: Any) -> bool:
     while isinstance(obj, functools.partial):
         obj = obj.func
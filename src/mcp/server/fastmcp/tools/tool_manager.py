@@ -33,6 +33,12 @@ class ToolManager:
                 self._tools[tool.name] = tool
 
         self.warn_on_duplicate_tools = warn_on_duplicate_tools
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """Counter bumped whenever the registered tools change."""
+        return self._version
 
     def get_tool(self, name: str) -> Tool | None:
         """Get tool by name."""
@@ -58,6 +64,7 @@ class ToolManager:
                 logger.warning(f"Tool already exists: {tool.name}")
             return existing
         self._tools[tool.name] = tool
+        self._version += 1
         return tool
 
     async def call_tool(
@@ -0,0 +1,59 @@
+"""Starlette router that dispatches with a single precompiled regex."""
+
+import re
+
+from starlette.routing import Match, Mount, Route, Router
+from starlette.types import Receive, Scope, Send
+
+# Named groups inside a route's path regex, e.g. `(?P<path>` in a Mount
+_NAMED_GROUP_RE = re.compile(r"(?<!\\)\(\?P<\w+>")
+
+
+class CompiledRouter(Router):
+    """Router that finds the first route matching a request path in one regex match.
+
+    The path regexes of all routes are joined into a single alternation, with
+    route ``i`` captured by the group ``r{i}``. The alternation is built on the
+    first request and rebuilt when routes are added.
+
+    The selected route is still checked with ``matches()``. Anything short of a
+    full match (wrong method, trailing-slash redirect, 404) falls back to
+    Starlette's linear scan, so dispatch behaves exactly like a plain ``Router``.
+    Routers holding anything but ``Route`` and ``Mount`` always use the linear scan.
+    """
+
+    _compiled: tuple[int, re.Pattern[str] | None] | None = None
+
+    def _get_pattern(self) -> re.Pattern[str] | None:
+        if self._compiled is not None and self._compiled[0] == len(self.routes):
+            return self._compiled[1]
+
+        pattern: re.Pattern[str] | None = None
+        alternatives: list[str] = []
+        for index, route in enumerate(self.routes):
+            if not isinstance(route, Route | Mount):
+                break
+            alternatives.append(f"(?P<r{index}>{_NAMED_GROUP_RE.sub('(?:', route.path_regex.pattern)})")
+        else:
+            if alternatives:
+                pattern = re.compile("|".join(alternatives))
+
+        self._compiled = (len(self.routes), pattern)
+        return pattern
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Routes match against the full path only when the app isn't mounted
+        if scope["type"] == "http" and not scope.get("root_path"):
+            pattern = self._get_pattern()
+            path_match = pattern.match(scope["path"]) if pattern is not None else None
+            if path_match is not None and path_match.lastgroup is not None:
+                route = self.routes[int(path_match.lastgroup[1:])]
+                match, child_scope = route.matches(scope)
+                if match == Match.FULL:
+                    if "router" not in scope:
+                        scope["router"] = self
+                    scope.update(child_scope)
+                    await route.handle(scope, receive, send)
+                    return
+
+        await super().__call__(scope, receive, send)
@@ -67,6 +67,7 @@ messages from the client.
 
 from __future__ import annotations as _annotations
 
+import base64
 import contextvars
 import json
 import logging
@@ -296,8 +297,6 @@ class Server(Generic[LifespanResultT, RequestT]):
                                 mimeType=mime_type or "text/plain",
                             )
                         case bytes() as data:
-                            import base64
-
                             return types.BlobResourceContents(
                                 uri=req.params.uri,
                                 blob=base64.b64encode(data).decode(),
@@ -342,6 +341,8 @@ class Server(Generic[LifespanResultT, RequestT]):
 
             async def handler(req: types.SetLevelRequest):
                 await func(req.params.level)
+                # Only an accepted request changes which messages the session sends
+                self.request_context.session.set_logging_level(req.params.level)
                 return types.ServerResult(types.EmptyResult())
 
             self.request_handlers[types.SetLevelRequest] = handler
@@ -38,7 +38,7 @@ be instantiated directly by users of the MCP framework.
 """
 
 from enum import Enum
-from typing import Any, TypeVar
+from typing import Any, TypeVar, get_args
 
 import anyio
 import anyio.lowlevel
@@ -63,6 +63,11 @@ class InitializationState(Enum):
 
 ServerSessionT = TypeVar("ServerSessionT", bound="ServerSession")
 
+# Log levels ordered from least to most severe, as listed in the protocol
+_LOG_LEVEL_SEVERITY: dict[types.LoggingLevel, int] = {
+    level: severity for severity, level in enumerate(get_args(types.LoggingLevel))
+}
+
 ServerRequestResponder = (
     RequestResponder[types.ClientRequest, types.ServerResult] | types.ClientNotification | Exception
 )
@@ -79,6 +84,8 @@ class ServerSession(
 ):
     _initialized: InitializationState = InitializationState.NotInitialized
     _client_params: types.InitializeRequestParams | None = None
+    _logging_level: types.LoggingLevel | None = None
+    _min_log_severity: int = 0
 
     def __init__(
         self,
@@ -102,6 +109,16 @@ class ServerSession(
     def client_params(self) -> types.InitializeRequestParams | None:
         return self._client_params
 
+    @property
+    def logging_level(self) -> types.LoggingLevel | None:
+        """The minimum log level the client asked for with logging/setLevel, if any."""
+        return self._logging_level
+
+    def set_logging_level(self, level: types.LoggingLevel) -> None:
+        """Drop log messages below `level`; applied once a logging/setLevel request is handled."""
+        self._logging_level = level
+        self._min_log_severity = _LOG_LEVEL_SEVERITY[level]
+
     def check_client_capability(self, capability: types.ClientCapabilities) -> bool:
         """Check if the client supports a specific capability."""
         if self._client_params is None:
@@ -182,7 +199,13 @@ class ServerSession(
         logger: str | None = None,
         related_request_id: types.RequestId | None = None,
     ) -> None:
-        """Send a log message notification."""
+        """Send a log message notification.
+
+        Messages below the level the client set with logging/setLevel are dropped.
+        """
+        if _LOG_LEVEL_SEVERITY[level] < self._min_log_severity:
+            return
+
         await self.send_notification(
             types.ServerNotification(
                 types.LoggingMessageNotification(
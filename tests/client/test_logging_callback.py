@@ -81,3 +81,83 @@ async def test_logging_callback():
         assert log.level == "info"
         assert log.logger == "test_logger"
         assert log.data == "Test log message"
+
+
+@pytest.mark.anyio
+async def test_logging_level_filters_messages():
+    from mcp.server.fastmcp import Context, FastMCP
+
+    server = FastMCP("test")
+    logging_collector = LoggingCollector()
+    requested_levels: list[types.LoggingLevel] = []
+
+    @server._mcp_server.set_logging_level()
+    async def set_logging_level(level: types.LoggingLevel) -> None:
+        requested_levels.append(level)
+
+    @server.tool("chatty_tool")
+    async def chatty_tool(ctx: Context) -> bool:
+        await ctx.debug("debug message")
+        await ctx.info("info message")
+        await ctx.warning("warning message")
+        await ctx.error("error message")
+        return True
+
+    async with create_session(server._mcp_server, logging_callback=logging_collector) as client_session:
+        await client_session.call_tool("chatty_tool", {})
+        assert [log.level for log in logging_collector.log_messages] == ["debug", "info", "warning", "error"]
+
+        logging_collector.log_messages.clear()
+        await client_session.set_logging_level("warning")
+        await client_session.call_tool("chatty_tool", {})
+
+        assert requested_levels == ["warning"]
+        assert [log.level for log in logging_collector.log_messages] == ["warning", "error"]
+
+
+@pytest.mark.anyio
+async def test_rejected_logging_level_does_not_filter_messages():
+    from mcp.server.fastmcp import Context, FastMCP
+    from mcp.shared.exceptions import McpError
+
+    server = FastMCP("test")
+    logging_collector = LoggingCollector()
+
+    @server.tool("chatty_tool")
+    async def chatty_tool(ctx: Context) -> bool:
+        await ctx.debug("debug message")
+        await ctx.error("error message")
+        return True
+
+    async with create_session(server._mcp_server, logging_callback=logging_collector) as client_session:
+        # No logging/setLevel handler is registered, so the request is rejected
+        with pytest.raises(McpError, match="Method not found"):
+            await client_session.set_logging_level("error")
+        await client_session.call_tool("chatty_tool", {})
+
+    assert [log.level for log in logging_collector.log_messages] == ["debug", "error"]
+
+
+@pytest.mark.anyio
+async def test_level_helpers_pass_logger_name():
+    from mcp.server.fastmcp import Context, FastMCP
+
+    server = FastMCP("test")
+    logging_collector = LoggingCollector()
+
+    @server.tool("named_logger_tool")
+    async def named_logger_tool(ctx: Context) -> str:
+        await ctx.info("hi", logger_name="mylog")
+        await ctx.error("unnamed")
+        return "ok"
+
+    async with create_session(server._mcp_server, logging_callback=logging_collector) as client_session:
+        result = await client_session.call_tool("named_logger_tool", {})
+        assert result.isError is False
+        assert isinstance(result.content[0], TextContent)
+        assert result.content[0].text == "ok"
+
+    assert [(log.level, log.logger, log.data) for log in logging_collector.log_messages] == [
+        ("info", "mylog", "hi"),
+        ("error", None, "unnamed"),
+    ]
@@ -9,10 +9,11 @@ from starlette.types import Message, Receive, Scope, Send
 
 from mcp.server.auth.middleware.auth_context import (
     AuthContextMiddleware,
+    BearerAuthContextMiddleware,
     auth_context_var,
     get_access_token,
 )
-from mcp.server.auth.middleware.bearer_auth import AuthenticatedUser
+from mcp.server.auth.middleware.bearer_auth import AuthenticatedUser, BearerAuthBackend
 from mcp.server.auth.provider import AccessToken
 
 
@@ -120,3 +121,77 @@ class TestAuthContextMiddleware:
         # Verify context is still empty after middleware
         assert auth_context_var.get() is None
         assert get_access_token() is None
+
+
+class StaticTokenVerifier:
+    """Token verifier backed by a fixed token table."""
+
+    def __init__(self, tokens: dict[str, AccessToken]):
+        self.tokens = tokens
+
+    async def verify_token(self, token: str) -> AccessToken | None:
+        return self.tokens.get(token)
+
+
+@pytest.mark.anyio
+class TestBearerAuthContextMiddleware:
+    """Tests for the BearerAuthContextMiddleware class."""
+
+    async def receive(self) -> Message:
+        return {"type": "http.request"}
+
+    async def send(self, message: Message) -> None:
+        pass
+
+    async def test_with_valid_token(self, valid_access_token: AccessToken):
+        """Test that a valid token authenticates the request and sets the context."""
+        app = MockApp()
+        backend = BearerAuthBackend(StaticTokenVerifier({"valid_token": valid_access_token}))
+        middleware = BearerAuthContextMiddleware(app, backend)
+
+        scope: Scope = {"type": "http", "headers": [(b"authorization", b"Bearer valid_token")]}
+        await middleware(scope, self.receive, self.send)
+
+        assert app.called
+        assert isinstance(scope["user"], AuthenticatedUser)
+        assert scope["auth"].scopes == ["read", "write"]
+        assert app.access_token_during_call == valid_access_token
+        assert auth_context_var.get() is None
+
+    async def test_without_authorization_header(self):
+        """Test that requests without an Authorization header pass through unauthenticated."""
+        app = MockApp()
+        middleware = BearerAuthContextMiddleware(app, BearerAuthBackend(StaticTokenVerifier({})))
+
+        scope: Scope = {"type": "http", "headers": []}
+        await middleware(scope, self.receive, self.send)
+
+        assert app.called
+        assert not scope["user"].is_authenticated
+        assert scope["auth"].scopes == []
+        assert app.access_token_during_call is None
+        assert auth_context_var.get() is None
+
+    async def test_with_unknown_token(self):
+        """Test that requests with an unknown token pass through unauthenticated."""
+        app = MockApp()
+        middleware = BearerAuthContextMiddleware(app, BearerAuthBackend(StaticTokenVerifier({})))
+
+        scope: Scope = {"type": "http", "headers": [(b"authorization", b"Bearer unknown")]}
+        await middleware(scope, self.receive, self.send)
+
+        assert app.called
+        assert not scope["user"].is_authenticated
+        assert scope["auth"].scopes == []
+        assert app.access_token_during_call is None
+
+    async def test_lifespan_passthrough(self):
+        """Test that non-HTTP scopes are passed through untouched."""
+        app = MockApp()
+        middleware = BearerAuthContextMiddleware(app, BearerAuthBackend(StaticTokenVerifier({})))
+
+        scope: Scope = {"type": "lifespan"}
+        await middleware(scope, self.receive, self.send)
+
+        assert app.called
+        assert scope == {"type": "lifespan"}
@@ -354,6 +354,30 @@ class TestRequireAuthMiddleware:
         assert any(h[0] == b"www-authenticate" for h in sent_messages[0]["headers"])
         assert not app.called
 
+    async def test_reports_first_missing_scope(self, valid_access_token: AccessToken):
+        """Test that the error names the first missing scope in required order."""
+        app = MockApp()
+        middleware = RequireAuthMiddleware(app, required_scopes=["read", "admin", "billing"])
+
+        user = AuthenticatedUser(valid_access_token)
+        auth = AuthCredentials(["read", "write"])
+
+        scope: Scope = {"type": "http", "user": user, "auth": auth}
+
+        async def receive() -> Message:
+            return {"type": "http.request"}
+
+        sent_messages = []
+
+        async def send(message: Message) -> None:
+            sent_messages.append(message)
+
+        await middleware(scope, receive, send)
+
+        assert sent_messages[0]["status"] == 403
+        assert b"Required scope: admin" in sent_messages[1]["body"]
+        assert not app.called
+
     async def test_no_auth_credentials(self, valid_access_token: AccessToken):
         """Test middleware with no auth credentials in scope."""
         app = MockApp()
@@ -0,0 +1,77 @@
+"""
+Tests for token verifier helpers in mcp.server.auth.provider.
+"""
+
+import time
+
+import pytest
+
+from mcp.server.auth.provider import AccessToken, CachingTokenVerifier
+
+
+class CountingTokenVerifier:
+    """Token verifier that records how often each token is verified."""
+
+    def __init__(self, tokens: dict[str, AccessToken]):
+        self.tokens = tokens
+        self.calls: list[str] = []
+
+    async def verify_token(self, token: str) -> AccessToken | None:
+        self.calls.append(token)
+        return self.tokens.get(token)
+
+
+def make_token(token: str, expires_at: int | None = None) -> AccessToken:
+    return AccessToken(token=token, client_id="client", scopes=["read"], expires_at=expires_at)
+
+
+@pytest.mark.anyio
+class TestCachingTokenVerifier:
+    async def test_caches_successful_verification(self):
+        inner = CountingTokenVerifier({"valid": make_token("valid")})
+        verifier = CachingTokenVerifier(inner)
+
+        first = await verifier.verify_token("valid")
+        second = await verifier.verify_token("valid")
+
+        assert first is not None
+        assert second is first
+        assert inner.calls == ["valid"]
+
+    async def test_does_not_cache_failures(self):
+        inner = CountingTokenVerifier({})
+        verifier = CachingTokenVerifier(inner)
+
+        assert await verifier.verify_token("invalid") is None
+        assert await verifier.verify_token("invalid") is None
+        assert inner.calls == ["invalid", "invalid"]
+
+    async def test_entry_expires_with_ttl(self):
+        inner = CountingTokenVerifier({"valid": make_token("valid")})
+        verifier = CachingTokenVerifier(inner, ttl_seconds=0)
+
+        await verifier.verify_token("valid")
+        await verifier.verify_token("valid")
+        assert inner.calls == ["valid", "valid"]
+
+    async def test_entry_expires_with_token(self):
+        inner = CountingTokenVerifier({"expired": make_token("expired", expires_at=int(time.time()) - 1)})
+        verifier = CachingTokenVerifier(inner, ttl_seconds=300)
+
+        await verifier.verify_token("expired")
+        await verifier.verify_token("expired")
+        assert inner.calls == ["expired", "expired"]
+
+    async def test_evicts_least_recently_used(self):
+        inner = CountingTokenVerifier({name: make_token(name) for name in ("a", "b", "c")})
+        verifier = CachingTokenVerifier(inner, max_size=2)
+
+        await verifier.verify_token("a")
+        await verifier.verify_token("b")
+        await verifier.verify_token("a")  # a is now the most recently used
+        await verifier.verify_token("c")  # evicts b
+        inner.calls.clear()
+
+        await verifier.verify_token("a")
+        await verifier.verify_token("b")
+        assert inner.calls == ["b"]
@@ -0,0 +1,39 @@
+"""
+Tests for the protected resource metadata routes.
+"""
+
+import httpx
+import pytest
+from httpx import ASGITransport
+from pydantic import AnyHttpUrl
+from starlette.applications import Starlette
+
+from mcp.server.auth.routes import create_protected_resource_routes
+
+
+@pytest.fixture
+def client():
+    routes = create_protected_resource_routes(
+        resource_url=AnyHttpUrl("https://api.example.com/mcp"),
+        authorization_servers=[AnyHttpUrl("https://auth.example.com")],
+        scopes_supported=["read"],
+    )
+    transport = ASGITransport(app=Starlette(routes=routes))
+    return httpx.AsyncClient(transport=transport, base_url="http://localhost")
+
+
+@pytest.mark.anyio
+async def test_protected_resource_metadata(client: httpx.AsyncClient):
+    for _ in range(2):
+        response = await client.get("/.well-known/oauth-protected-resource", headers={"Origin": "https://app.test"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.headers["cache-control"] == "public, max-age=3600"
+        assert response.headers["access-control-allow-origin"] == "*"
+        assert response.json() == {
+            "resource": "https://api.example.com/mcp",
+            "authorization_servers": ["https://auth.example.com/"],
+            "scopes_supported": ["read"],
+            "bearer_methods_supported": ["header"],
+        }
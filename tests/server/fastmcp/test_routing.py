@@ -0,0 +1,82 @@
+"""Tests for the precompiled Starlette router."""
+
+import httpx
+import pytest
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, Response
+from starlette.routing import BaseRoute, Mount, Route
+from starlette.types import Receive, Scope, Send
+
+from mcp.server.fastmcp.utilities.routing import CompiledRouter
+
+
+def make_endpoint(text: str):
+    async def endpoint(request: Request) -> Response:
+        return PlainTextResponse(f"{text} {dict(request.path_params)}")
+
+    return endpoint
+
+
+async def mounted_app(scope: Scope, receive: Receive, send: Send) -> None:
+    response = PlainTextResponse(f"mounted {scope['path']}")
+    await response(scope, receive, send)
+
+
+def make_app(routes: list[BaseRoute]) -> Starlette:
+    app = Starlette()
+    app.router = CompiledRouter(routes)
+    return app
+
+
+def make_client(app: Starlette) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://testserver")
+
+
+@pytest.mark.anyio
+async def test_dispatches_to_first_matching_route():
+    app = make_app(
+        [
+            Route("/items/{item_id}", make_endpoint("first")),
+            Route("/items/{name}", make_endpoint("second")),
+            Mount("/messages", app=mounted_app),
+        ]
+    )
+
+    async with make_client(app) as client:
+        assert (await client.get("/items/42")).text == "first {'item_id': '42'}"
+        assert (await client.get("/messages/abc")).text == "mounted /abc"
+
+
+@pytest.mark.anyio
+async def test_falls_back_for_method_mismatch():
+    app = make_app(
+        [
+            Route("/thing", make_endpoint("get"), methods=["GET"]),
+            Route("/thing", make_endpoint("post"), methods=["POST"]),
+        ]
+    )
+
+    async with make_client(app) as client:
+        assert (await client.post("/thing")).text == "post {}"
+        assert (await client.put("/thing")).status_code == 405
+
+
+@pytest.mark.anyio
+async def test_falls_back_for_missing_routes():
+    app = make_app([Route("/thing", make_endpoint("thing"))])
+
+    async with make_client(app) as client:
+        assert (await client.get("/missing")).status_code == 404
+        assert (await client.get("/thing/")).status_code == 307
+
+
+@pytest.mark.anyio
+async def test_recompiles_when_routes_added():
+    app = make_app([Route("/a", make_endpoint("a"))])
+
+    async with make_client(app) as client:
+        assert (await client.get("/a")).text == "a {}"
+
+        app.router.routes.append(Route("/b", make_endpoint("b")))
+        assert (await client.get("/b")).text == "b {}"
@@ -5,12 +5,15 @@ from unittest.mock import patch
 
 import pytest
 from pydantic import AnyUrl
+from starlette.requests import Request
+from starlette.responses import Response
 from starlette.routing import Mount, Route
 
 from mcp.server.fastmcp import Context, FastMCP
 from mcp.server.fastmcp.prompts.base import Message, UserMessage
-from mcp.server.fastmcp.resources import FileResource, FunctionResource
+from mcp.server.fastmcp.resources import FileResource, FunctionResource, TextResource
 from mcp.server.fastmcp.utilities.types import Image
+from mcp.shared.context import RequestContext
 from mcp.shared.exceptions import McpError
 from mcp.shared.memory import (
     create_connected_server_and_client_session as client_session,
@@ -21,6 +24,7 @@ from mcp.types import (
     ContentBlock,
     EmbeddedResource,
     ImageContent,
+    RequestParams,
     TextContent,
     TextResourceContents,
 )
@@ -36,6 +40,51 @@ class TestServer:
         assert mcp.name == "FastMCP"
         assert mcp.instructions == "Server instructions"
 
+    @pytest.mark.anyio
+    async def test_default_settings_not_shared(self, monkeypatch: pytest.MonkeyPatch):
+        """Test that servers built from default settings don't share state."""
+        first = FastMCP()
+        first.settings.mount_path = "/first"
+        first.settings.dependencies.append("pandas")
+
+        second = FastMCP()
+        assert second.settings.mount_path == "/"
+        assert second.settings.dependencies == []
+
+        monkeypatch.setenv("FASTMCP_PORT", "9000")
+        assert FastMCP().settings.port == 9000
+
+    def test_default_settings_follow_env_file(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        """Test that edits to .env are picked up by servers built afterwards."""
+        monkeypatch.chdir(tmp_path)
+        assert FastMCP().settings.port == 8000
+
+        (tmp_path / ".env").write_text("FASTMCP_PORT=9123\n")
+        assert FastMCP().settings.port == 9123
+
+        (tmp_path / ".env").write_text("FASTMCP_PORT=9124\nFASTMCP_DEBUG=true\n")
+        assert FastMCP().settings.port == 9124
+
+        (tmp_path / ".env").unlink()
+        assert FastMCP().settings.port == 8000
+
+    def test_initialization_options_cached(self):
+        """Test that initialization options are reused until handlers change."""
+        mcp = FastMCP()
+        options = mcp._get_initialization_options()
+        assert mcp._get_initialization_options() is options
+
+        @mcp.completion()
+        async def handle_completion(ref, argument, context):  # type: ignore[no-untyped-def]
+            return None
+
+        assert mcp._get_initialization_options() is not options
+
+    def test_run_unknown_transport(self):
+        mcp = FastMCP()
+        with pytest.raises(ValueError, match="Unknown transport: carrier-pigeon"):
+            mcp.run("carrier-pigeon")  # type: ignore[arg-type]
+
     @pytest.mark.anyio
     async def test_normalize_path(self):
         """Test path normalization for mount paths."""
@@ -81,6 +130,61 @@ class TestServer:
             # Verify _normalize_path was called with correct args
             mock_normalize.assert_called_once_with("/param", "/messages/")
 
+    @pytest.mark.anyio
+    async def test_sse_app_reuses_transport(self):
+        """Test that the SSE transport and routes are only rebuilt when the mount path changes."""
+        mcp = FastMCP()
+        with patch.object(mcp, "_normalize_path", wraps=mcp._normalize_path) as mock_normalize:
+            first = mcp.sse_app()
+            transport = mcp._sse_transport
+            second = mcp.sse_app()
+            assert mcp._sse_transport is transport
+            assert first.routes[0] is second.routes[0]
+            mock_normalize.assert_called_once_with("/", "/messages/")
+
+            mcp.sse_app(mount_path="/other")
+            assert mcp._sse_transport is not transport
+            assert mock_normalize.call_count == 2
+
+    @pytest.mark.anyio
+    async def test_apps_memoized_until_custom_route_added(self):
+        """Test that the Starlette apps are reused until a custom route is registered."""
+        mcp = FastMCP()
+        sse = mcp.sse_app()
+        streamable = mcp.streamable_http_app()
+        assert mcp.sse_app() is sse
+        assert mcp.streamable_http_app() is streamable
+
+        @mcp.custom_route("/health", methods=["GET"])
+        async def health(request: Request) -> Response:
+            return Response()
+
+        new_sse = mcp.sse_app()
+        new_streamable = mcp.streamable_http_app()
+        assert new_sse is not sse
+        assert new_streamable is not streamable
+        assert any(getattr(route, "path", None) == "/health" for route in new_sse.routes)
+        assert any(getattr(route, "path", None) == "/health" for route in new_streamable.routes)
+
+    @pytest.mark.anyio
+    async def test_asgi_app_serves_both_transports(self):
+        """Test that the combined app exposes the SSE and StreamableHTTP endpoints once."""
+        mcp = FastMCP()
+        app = mcp.asgi_app()
+        assert mcp.asgi_app() is app
+
+        paths = [getattr(route, "path", None) for route in app.routes]
+        assert paths == ["/sse", "/messages", "/mcp"]
+        assert mcp.session_manager is not None
+
+        @mcp.custom_route("/health", methods=["GET"])
+        async def health(request: Request) -> Response:
+            return Response()
+
+        new_app = mcp.asgi_app()
+        assert new_app is not app
+        assert [getattr(route, "path", None) for route in new_app.routes] == ["/sse", "/messages", "/mcp", "/health"]
+
     @pytest.mark.anyio
     async def test_starlette_routes_with_mount_path(self):
         """Test that Starlette routes are correctly configured with mount path."""
@@ -218,6 +322,31 @@ class TestServerTools:
             tools = await client.list_tools()
             assert len(tools.tools) == 1
 
+    @pytest.mark.anyio
+    async def test_list_tools_cached_until_tool_added(self):
+        mcp = FastMCP()
+        mcp.add_tool(tool_fn)
+        first = await mcp.list_tools()
+        assert await mcp.list_tools() is first
+
+        mcp.add_tool(tool_fn)  # duplicate, registry unchanged
+        assert await mcp.list_tools() is first
+
+        mcp.add_tool(tool_fn, name="other_tool")
+        tools = await mcp.list_tools()
+        assert tools is not first
+        assert {t.name for t in tools} == {"tool_fn", "other_tool"}
+
+    @pytest.mark.anyio
+    async def test_list_many_tools(self):
+        """Test listing a registry large enough to be built in a worker thread."""
+        mcp = FastMCP()
+        for i in range(100):
+            mcp.add_tool(tool_fn, name=f"tool_{i}")
+        async with client_session(mcp._mcp_server) as client:
+            tools = await client.list_tools()
+            assert [t.name for t in tools.tools] == [f"tool_{i}" for i in range(100)]
+
     @pytest.mark.anyio
     async def test_call_tool(self):
         mcp = FastMCP()
@@ -350,6 +479,25 @@ class TestServerTools:
             assert isinstance(content4, TextContent)
             assert content4.text == "direct content"
 
+    @pytest.mark.anyio
+    async def test_tool_nested_list(self):
+        """Test that nested lists are flattened in order and None items are skipped"""
+
+        def nested_list_fn() -> list:
+            return ["a", ["b", None, ("c", ["d"])], None, "e"]
+
+        mcp = FastMCP()
+        mcp.add_tool(nested_list_fn)
+        async with client_session(mcp._mcp_server) as client:
+            result = await client.call_tool("nested_list_fn", {})
+            assert [content.text for content in result.content if isinstance(content, TextContent)] == [
+                "a",
+                "b",
+                "c",
+                "d",
+                "e",
+            ]
+
 
 class TestServerResources:
     @pytest.mark.anyio
@@ -442,6 +590,24 @@ class TestServerResources:
             assert resource.name == "test_get_data"
             assert resource.mimeType == "text/plain"
 
+    @pytest.mark.anyio
+    async def test_list_resources_cached_until_resource_added(self):
+        mcp = FastMCP()
+        mcp.add_resource(TextResource(uri=AnyUrl("resource://a"), name="a", text="a"))
+        resources = await mcp.list_resources()
+        templates = await mcp.list_resource_templates()
+        assert await mcp.list_resources() is resources
+        assert await mcp.list_resource_templates() is templates
+
+        @mcp.resource("resource://{name}")
+        def get_data(name: str) -> str:
+            return name
+
+        assert await mcp.list_resources() is not resources
+        new_templates = await mcp.list_resource_templates()
+        assert new_templates is not templates
+        assert [t.uriTemplate for t in new_templates] == ["resource://{name}"]
+
 
 class TestServerResourceTemplates:
     @pytest.mark.anyio
@@ -674,6 +840,24 @@ class TestContextInjection:
             assert isinstance(content, TextContent)
             assert content.text == "42"
 
+    @pytest.mark.anyio
+    async def test_report_progress_without_token(self):
+        """Test that progress is only sent when the client asked for it."""
+        mcp = FastMCP()
+
+        async def progress_tool(ctx: Context) -> str:
+            await ctx.report_progress(1, 2)
+            return "done"
+
+        mcp.add_tool(progress_tool)
+        with patch("mcp.server.session.ServerSession.send_progress_notification") as mock_progress:
+            async with client_session(mcp._mcp_server) as client:
+                await client.call_tool("progress_tool", {})
+            mock_progress.assert_not_called()
+
+        with pytest.raises(ValueError, match="Context is not available outside of a request"):
+            await Context().report_progress(1, 2)
+
     @pytest.mark.anyio
     async def test_context_resource_access(self):
         """Test that context can access resources."""
@@ -698,6 +882,23 @@ class TestContextInjection:
             assert isinstance(content, TextContent)
             assert "Read resource: resource data" in content.text
 
+    def test_context_client_id(self):
+        """Test that the client ID is read from the request metadata."""
+
+        def make_context(meta: RequestParams.Meta | None) -> Context:
+            request_context = RequestContext(request_id=1, meta=meta, session=None, lifespan_context=None)
+            return Context(request_context=request_context)  # type: ignore[arg-type]
+
+        assert make_context(RequestParams.Meta(client_id="client-1")).client_id == "client-1"  # type: ignore[call-arg]
+        assert make_context(RequestParams.Meta()).client_id is None
+        assert make_context(None).client_id is None
+
+    @pytest.mark.anyio
+    async def test_context_read_resource_outside_request(self):
+        """Test that reading a resource needs a server-bound context."""
+        with pytest.raises(ValueError, match="Context is not available outside of a request"):
+            await Context().read_resource("test://data")
+
 
 class TestServerPrompts:
     """Test prompt functionality in FastMCP server."""
@@ -782,6 +983,25 @@ class TestServerPrompts:
             assert prompt.arguments[1].name == "optional"
             assert prompt.arguments[1].required is False
 
+    @pytest.mark.anyio
+    async def test_list_prompts_cached_until_prompt_added(self):
+        mcp = FastMCP()
+
+        @mcp.prompt()
+        def first() -> str:
+            return "first"
+
+        prompts = await mcp.list_prompts()
+        assert await mcp.list_prompts() is prompts
+
+        @mcp.prompt()
+        def second() -> str:
+            return "second"
+
+        new_prompts = await mcp.list_prompts()
+        assert new_prompts is not prompts
+        assert [p.name for p in new_prompts] == ["first", "second"]
+
     @pytest.mark.anyio
     async def test_get_prompt(self):
         """Test getting a prompt through MCP protocol."""
@@ -351,6 +351,13 @@ class TestContextHandling:
         tool = manager.add_tool(tool_with_parametrized_context)
         assert tool.context_kwarg == "ctx"
 
+        def tool_with_optional_context(x: int, ctx: Context | None = None) -> str:
+            return str(x)
+
+        tool = manager.add_tool(tool_with_optional_context)
+        assert tool.context_kwarg == "ctx"
+        assert "ctx" not in tool.parameters["properties"]
+
     @pytest.mark.anyio
     async def test_context_injection(self):
         """Test that context is properly injected during tool execution."""